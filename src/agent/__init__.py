@@ -3,16 +3,31 @@ Podcast Agent Module
 
 This package provides agent capabilities for podcast analysis, summarization,
 and insight extraction.
+
+Exports are resolved lazily (PEP 562) so that importing the package does not
+build the LLM client or compile the graph until one of them is used.
 """
 
-from .summarizer_agent import (
-    graph as summarizer_graph,
-    create_agent_graph,
-    State as SummarizerState
-)
+from typing import Any
+
+# Public name -> attribute in summarizer_agent
+_LAZY_EXPORTS = {
+    'graph': 'graph',
+    'chat_model': 'chat_model',
+    'summarizer_graph': 'graph',
+    'create_agent_graph': 'create_agent_graph',
+    'SummarizerState': 'State',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        from . import summarizer_agent
+        return getattr(summarizer_agent, _LAZY_EXPORTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'summarizer_graph',
     'create_agent_graph',
-    'SummarizerState'
+    'SummarizerState',
+    'chat_model'
 ]
@@ -1,9 +1,17 @@
 import os
+import json
+import asyncio
+import weakref
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
 
+import httpx
 from langchain_core.messages import SystemMessage, BaseMessage
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -25,10 +33,20 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "o4-mini"
 DEFAULT_TEMPERATURE = 1.0
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_LLM_CACHE_SIZE = 256
+DEFAULT_LLM_CONCURRENCY = 4
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE = 20
 
 # Initialize LLM with proper configuration handling
+@lru_cache(maxsize=1)
 def get_llm_config() -> Dict[str, Any]:
-    """Get LLM configuration with fallbacks to environment variables."""
+    """
+    Get LLM configuration with fallbacks to environment variables.
+    
+    The result is cached for the life of the process; copy it before
+    applying per-call overrides.
+    """
     return {
         "model": os.getenv("LLM_MODEL", DEFAULT_MODEL),
         "temperature": float(os.getenv("LLM_TEMPERATURE", DEFAULT_TEMPERATURE)),
@@ -38,18 +56,111 @@ def get_llm_config() -> Dict[str, Any]:
         "api_key": os.getenv("OPENAI_API_KEY")
     }
 
+def get_http_limits() -> httpx.Limits:
+    """Get connection pool limits for the OpenAI HTTP clients."""
+    return httpx.Limits(
+        max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", DEFAULT_HTTP_MAX_CONNECTIONS)),
+        max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", DEFAULT_HTTP_MAX_KEEPALIVE))
+    )
+
 try:
     llm_config = get_llm_config()
-    llm = ChatOpenAI(**llm_config)
+    # Share keep-alive connection pools across all calls made by this client
+    http_limits = get_http_limits()
+    llm = ChatOpenAI(
+        **llm_config,
+        http_client=httpx.Client(limits=http_limits),
+        http_async_client=httpx.AsyncClient(limits=http_limits)
+    )
     logger.info(f"Initialized LLM with model: {llm_config['model']}")
     
-    # Bind system message and tools
+    # Plain chat model (no tools) for single-shot tasks sharing the same pools
+    chat_model = llm
+    
+    # Bind system message and tools. Tool schemas and the system prompt form the
+    # request prefix, so both are kept byte-identical across calls to benefit
+    # from provider-side prompt caching
     sys_msg = SystemMessage(content=system_message)
-    llm = llm.bind_tools(tools)
+    llm = llm.bind_tools(sorted(tools, key=lambda tool: tool.__name__))
 except Exception as e:
     logger.error(f"Failed to initialize LLM: {str(e)}")
     raise RuntimeError(f"Agent initialization failed: {str(e)}")
 
+# Response cache for deterministic (temperature == 0) models, keyed on the prompt
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", DEFAULT_LLM_CACHE_SIZE))
+_response_cache: "OrderedDict[str, BaseMessage]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Cap on concurrent async LLM calls to stay within provider rate limits
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", DEFAULT_LLM_CONCURRENCY))
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return semaphore
+
+def _cache_enabled() -> bool:
+    """Only cache responses when the model output is deterministic."""
+    return LLM_CACHE_SIZE > 0 and llm_config["temperature"] == 0
+
+def _cache_key(messages: List[BaseMessage]) -> str:
+    """Build a stable SHA256 key from the model name and message history."""
+    payload = {
+        "model": llm_config["model"],
+        "messages": [(m.type, m.content, getattr(m, "tool_calls", None)) for m in messages]
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+def _cache_lookup(key: str) -> Optional[BaseMessage]:
+    """Return a copy of the cached response for a key, if any."""
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None:
+            return None
+        _response_cache.move_to_end(key)
+    logger.debug("LLM response cache hit")
+    return cached.model_copy()
+
+def _cache_store(key: str, response: BaseMessage) -> None:
+    """Store a response, evicting the least recently used entry when full."""
+    with _response_cache_lock:
+        _response_cache[key] = response
+        if len(_response_cache) > LLM_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+def _cached_invoke(messages: List[BaseMessage]) -> BaseMessage:
+    """Invoke the LLM, returning a previously seen response when possible."""
+    if not _cache_enabled():
+        return llm.invoke(messages)
+    
+    key = _cache_key(messages)
+    cached = _cache_lookup(key)
+    if cached is not None:
+        return cached
+    
+    response = llm.invoke(messages)
+    _cache_store(key, response)
+    return response
+
+async def _cached_ainvoke(messages: List[BaseMessage]) -> BaseMessage:
+    """Async variant of `_cached_invoke`, bounded by the LLM concurrency limit."""
+    key = _cache_key(messages) if _cache_enabled() else None
+    if key:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            return cached
+    
+    async with _get_llm_semaphore():
+        response = await llm.ainvoke(messages)
+    
+    if key:
+        _cache_store(key, response)
+    return response
+
 class State(TypedDict):
     """State definition for the agent's graph."""
     messages: Annotated[List[BaseMessage], add_messages]
@@ -66,7 +177,7 @@ def reasoner(state: State) -> Dict[str, Any]:
     """
     try:
         messages = [sys_msg] + state["messages"]
-        response = llm.invoke(messages)
+        response = _cached_invoke(messages)
         return {"messages": response}
     except Exception as e:
         logger.error(f"Reasoning error: {str(e)}")
@@ -74,13 +185,33 @@ def reasoner(state: State) -> Dict[str, Any]:
         error_message = f"I encountered an error while processing: {str(e)}. Let me try a different approach."
         return {"messages": [SystemMessage(content=error_message)]}
 
+async def areasoner(state: State) -> Dict[str, Any]:
+    """
+    Async variant of `reasoner`, used when the graph runs via `ainvoke`.
+    
+    Args:
+        state: Current state containing message history
+        
+    Returns:
+        Updated state with new assistant messages
+    """
+    try:
+        messages = [sys_msg] + state["messages"]
+        response = await _cached_ainvoke(messages)
+        return {"messages": response}
+    except Exception as e:
+        logger.error(f"Reasoning error: {str(e)}")
+        error_message = f"I encountered an error while processing: {str(e)}. Let me try a different approach."
+        return {"messages": [SystemMessage(content=error_message)]}
+
 # Graph definition
 def create_agent_graph() -> Runnable:
     """Create and return the agent workflow graph."""
     graph_builder = StateGraph(State)
     
     # Add nodes
-    graph_builder.add_node("reasoner", reasoner)
+    # The reasoner runs synchronously under invoke and asynchronously under ainvoke
+    graph_builder.add_node("reasoner", RunnableLambda(reasoner, afunc=areasoner))
     graph_builder.add_node("tools", ToolNode(tools))
     
     # Connect nodes
@@ -88,7 +219,8 @@ def create_agent_graph() -> Runnable:
     graph_builder.add_conditional_edges("reasoner", tools_condition)
     graph_builder.add_edge("tools", "reasoner")
     
-    # Compile graph
+    # Compile graph. Every run starts from a fresh message list and nothing
+    # resumes a thread, so no checkpointer is attached
     return graph_builder.compile()
 
 # Initialize the graph
@@ -1,23 +1,38 @@
 import os
+import hashlib
 import logging
+import threading
 import time
-from typing import Dict, Any, Tuple, Optional
+from concurrent.futures import Future
+from typing import Dict, Any, Iterator, List, Tuple, Optional
 
+import orjson
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+from pydantic import BaseModel, Field, ValidationError
 from werkzeug.exceptions import BadRequest, InternalServerError
 from dotenv import load_dotenv
 
 # Fix the import path
 try:
-    from src.api.retriever import retrieve_and_respond, llm
+    from src.api.retriever import retrieve_and_respond, retrieve_and_stream, llm
 except ImportError:
     # Handle relative import when running as module
-    from retriever import retrieve_and_respond, llm
+    from retriever import retrieve_and_respond, retrieve_and_stream, llm
+
+try:
+    from src.db.schema import get_podcast_collection
+except ImportError:
+    from db.schema import get_podcast_collection
 
 # Load environment variables
 load_dotenv()
 
+# Skip LangChain tracing serialization unless explicitly enabled
+os.environ.setdefault("LANGCHAIN_TRACING_V2", "false")
+
 # Configure logging
 logging.basicConfig(
     level=os.getenv('LOG_LEVEL', 'INFO'),
@@ -25,22 +40,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Add CORS support for frontend integration
 
+# Compress large JSON payloads; SSE streams are left uncompressed so tokens
+# are delivered incrementally
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 4
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["COMPRESS_STREAMS"] = False
+Compress(app)
+
 # API configuration
 DEFAULT_PORT = 5000
 API_VERSION = "v1"
 PREFIX = f"/api/{API_VERSION}"
 
+# Static health payload, serialized once
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "version": API_VERSION,
+    "service": "podcast-insight-agent"
+})
+
+# Single-flight registry of /chat questions currently being answered; requests
+# run on separate worker threads, so a thread-safe Future is shared
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+class ChatRequest(BaseModel):
+    """Request body for the chat endpoint."""
+    message: str = Field(min_length=1)
+
+def _sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data).decode()}\n\n"
+
+def _respond_once(question: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Answer a question, coalescing concurrent identical requests.
+    
+    The first request for a question runs the retrieval; requests for the same
+    question that arrive while it is in flight wait for its result instead.
+    """
+    key = hashlib.sha256(question.encode()).hexdigest()
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+    
+    if not is_leader:
+        logger.info("Joining in-flight request for identical query")
+        return future.result()
+    
+    try:
+        result = retrieve_and_respond(question, llm)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+def _stream_chat(question: str, start_time: float) -> Response:
+    """
+    Stream the answer to a chat query as Server-Sent Events.
+    
+    Emits one `data: {"token": ...}` message per LLM chunk, followed by an
+    `event: metadata` message carrying the sources and timing.
+    """
+    tokens, metadata_list = retrieve_and_stream(question, llm)
+    
+    def generate() -> Iterator[str]:
+        try:
+            for token in tokens:
+                yield _sse({"token": token})
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}", exc_info=True)
+            yield _sse({"status": "error", "message": "Internal server error"}, event="error")
+            return
+        
+        execution_time = time.time() - start_time
+        logger.info(f"Query streamed in {execution_time:.2f}s")
+        yield _sse({
+            "metadata": metadata_list,
+            "processing_time": f"{execution_time:.2f}s"
+        }, event="metadata")
+    
+    return Response(generate(), mimetype='text/event-stream', headers={"Cache-Control": "no-cache"})
+
 @app.route(f'{PREFIX}/chat', methods=['POST'])
 def chat() -> Response:
     """
     Process a chat query about podcasts and return AI-generated insights.
     
     Expects JSON input with format: {"message": "your question here"}
-    Returns JSON with AI response and source metadata.
+    Returns JSON with AI response and source metadata, or streams the response
+    as Server-Sent Events when the client sends `Accept: text/event-stream`.
     
     Returns:
         Flask response containing the AI response and podcast metadata
@@ -49,46 +162,41 @@ def chat() -> Response:
         # Track execution time
         start_time = time.time()
         
-        # Validate request data
-        if not request.is_json:
-            logger.warning("Invalid request: Content-Type is not JSON")
-            return jsonify({
-                "status": "error",
-                "message": "Request must be JSON"
-            }), 400
-            
-        data = request.get_json()
-        if not data or 'message' not in data:
-            logger.warning("Invalid request: Missing 'message' field")
-            return jsonify({
-                "status": "error",
-                "message": "Request must include 'message' field"
-            }), 400
-            
-        question = data.get('message', '')
-        if not question or not isinstance(question, str):
-            logger.warning("Invalid request: 'message' must be a non-empty string")
+        # Parse and validate the request body in a single pass
+        try:
+            body = ChatRequest.model_validate_json(request.get_data(cache=False))
+        except ValidationError as e:
+            logger.warning(f"Invalid request: {e.error_count()} validation error(s)")
+            # The input is left out: for malformed JSON it is the raw request
+            # bytes, which cannot be serialized
             return jsonify({
                 "status": "error",
-                "message": "'message' must be a non-empty string"
+                "message": e.errors(include_url=False, include_input=False)
             }), 400
         
+        question = body.message
+        
         # Process the query
         logger.info(f"Processing query: {question[:50]}{'...' if len(question) > 50 else ''}")
-        response, metadata_list = retrieve_and_respond(question, llm)
+        
+        if request.accept_mimetypes.best_match(['application/json', 'text/event-stream']) == 'text/event-stream':
+            return _stream_chat(question, start_time)
+        
+        response, metadata_list = _respond_once(question)
         
         # Calculate execution time
         execution_time = time.time() - start_time
         logger.info(f"Query processed in {execution_time:.2f}s")
         
-        return jsonify({
+        payload = {
             "status": "success",
             "data": {
                 "response": response,
                 "metadata": metadata_list,
                 "processing_time": f"{execution_time:.2f}s"
             }
-        })
+        }
+        return Response(orjson.dumps(payload), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error processing request: {str(e)}", exc_info=True)
@@ -106,11 +214,7 @@ def health() -> Response:
     Returns:
         Flask response with status information
     """
-    return jsonify({
-        "status": "ok",
-        "version": API_VERSION,
-        "service": "podcast-insight-agent"
-    }), 200
+    return Response(_HEALTH_BODY, status=200, mimetype='application/json')
 
 @app.errorhandler(404)
 def not_found(e) -> Response:
@@ -135,6 +239,12 @@ def create_app() -> Flask:
     Returns:
         Configured Flask application
     """
+    # Warm up the MongoDB connection pool and indexes outside the request path
+    try:
+        get_podcast_collection()
+    except Exception as e:
+        logger.warning(f"MongoDB warm-up skipped: {str(e)}")
+    
     return app
 
 if __name__ == '__main__':
@@ -142,4 +252,4 @@ if __name__ == '__main__':
     debug = os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 't')
     
     logger.info(f"Starting Podcast Insight Agent API on port {port}")
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    create_app().run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
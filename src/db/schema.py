@@ -1,45 +1,171 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from functools import lru_cache
 from pymongo import MongoClient, ASCENDING, TEXT
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.server_api import ServerApi
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pydantic import BaseModel, ConfigDict, ValidationError
 import os
+import asyncio
 import logging
+import threading
+import weakref
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_db_connection() -> MongoClient:
-    """Get a connection to the MongoDB database."""
-    mongodb_uri = os.getenv("MONGODB_URI")
+# Client settings shared by every MongoDB caller in the process: a small pool,
+# wire compression for the large Markdown summaries, and short timeouts so
+# callers fail fast instead of stalling
+MONGO_MAX_POOL_SIZE = 20
+MONGO_MIN_POOL_SIZE = 2
+MONGO_CLIENT_OPTIONS = {
+    "server_api": ServerApi("1"),
+    "maxPoolSize": MONGO_MAX_POOL_SIZE,
+    "minPoolSize": MONGO_MIN_POOL_SIZE,
+    "compressors": "zstd,zlib",
+    "serverSelectionTimeoutMS": 3000,
+    "socketTimeoutMS": 10000,
+    "retryWrites": True,
+}
+
+def _get_mongodb_uri() -> str:
+    # The lowercase name is still read for older .env files
+    mongodb_uri = os.getenv("MONGODB_URI") or os.getenv("mongodb_uri")
     if not mongodb_uri:
         raise EnvironmentError("MONGODB_URI environment variable is not set")
+    return mongodb_uri
+
+# Guards one-time index creation and the cached collection handle
+_indexes_ready = False
+_indexes_lock = threading.Lock()
+_COLLECTION: Optional[Collection] = None
+
+@lru_cache(maxsize=1)
+def get_db_connection() -> MongoClient:
+    """Get a pooled connection to the MongoDB database, reused across calls."""
+    return MongoClient(_get_mongodb_uri(), **MONGO_CLIENT_OPTIONS)
+
+# Motor clients are bound to one event loop; keep one per live loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncIOMotorClient]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+def _get_async_db_connection(loop: asyncio.AbstractEventLoop) -> AsyncIOMotorClient:
+    """Get a pooled async MongoDB client bound to the given event loop."""
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            # A client references its loop, so entries are not collected on
+            # their own; close the ones whose loop has finished
+            for old_loop, old_client in list(_async_clients.items()):
+                if old_loop.is_closed():
+                    old_client.close()
+                    del _async_clients[old_loop]
+            client = _async_clients[loop] = AsyncIOMotorClient(
+                _get_mongodb_uri(), io_loop=loop, **MONGO_CLIENT_OPTIONS
+            )
+        return client
+
+def _ensure_indexes(collection: Collection) -> None:
+    """Create the collection indexes once per process."""
+    global _indexes_ready
+    if _indexes_ready:
+        return
     
-    return MongoClient(mongodb_uri)
+    with _indexes_lock:
+        if _indexes_ready:
+            return
+        
+        try:
+            # Create a text index for searching
+            collection.create_index([("podcast_title", TEXT), ("podcast_summary", TEXT)])
+            
+            # Create an index on episode_id for lookups
+            collection.create_index([("episode_id", ASCENDING)], unique=True)
+            
+            # Create an index on database_record_date for sorting
+            collection.create_index([("database_record_date", ASCENDING)])
+            
+            _indexes_ready = True
+            logger.info("MongoDB indexes created or already exist")
+        except Exception as e:
+            logger.error(f"Error creating MongoDB indexes: {str(e)}")
 
 def get_podcast_collection() -> Collection:
     """Get the podcast summaries collection with proper schema and indexes."""
+    global _COLLECTION
+    if _COLLECTION is not None:
+        return _COLLECTION
+    
     client = get_db_connection()
     db = client.podcast_agent_results
     collection = db.podcast_summaries
     
     # Create indexes if they don't exist
-    try:
-        # Create a text index for searching
-        collection.create_index([("podcast_title", TEXT), ("podcast_summary", TEXT)])
-        
-        # Create an index on episode_id for lookups
-        collection.create_index([("episode_id", ASCENDING)], unique=True)
-        
-        # Create an index on database_record_date for sorting
-        collection.create_index([("database_record_date", ASCENDING)])
-        
-        logger.info("MongoDB indexes created or already exist")
-    except Exception as e:
-        logger.error(f"Error creating MongoDB indexes: {str(e)}")
+    _ensure_indexes(collection)
     
+    _COLLECTION = collection
     return collection
 
+def get_async_podcast_collection() -> AsyncIOMotorCollection:
+    """
+    Get the podcast summaries collection for use inside a coroutine.
+    
+    Indexes are managed by the sync `get_podcast_collection`; the sync API is
+    still the one to use from CLI and cron code paths.
+    """
+    client = _get_async_db_connection(asyncio.get_running_loop())
+    return client.podcast_agent_results.podcast_summaries
+
+# Fields returned by search queries; large fields are left on the server
+SEARCH_PROJECTION = {
+    "_id": 0,
+    "episode_id": 1,
+    "podcast_title": 1,
+    "podcast_url": 1,
+    "podcast_summary": 1,
+}
+
+def search_podcasts(query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Search podcasts through the MongoDB text index, best matches first.
+    
+    Args:
+        query: Free-text search query
+        limit: Maximum number of podcasts to return
+        
+    Returns:
+        List of projected podcast documents
+    """
+    collection = get_podcast_collection()
+    projection = {**SEARCH_PROJECTION, "score": {"$meta": "textScore"}}
+    cursor = collection.find({"$text": {"$search": query}}, projection)
+    return list(cursor.sort([("score", {"$meta": "textScore"})]).limit(limit))
+
+async def search_podcasts_async(query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """Async variant of `search_podcasts`."""
+    collection = get_async_podcast_collection()
+    projection = {**SEARCH_PROJECTION, "score": {"$meta": "textScore"}}
+    cursor = collection.find({"$text": {"$search": query}}, projection)
+    return await cursor.sort([("score", {"$meta": "textScore"})]).limit(limit).to_list(length=limit)
+
+async def get_latest_podcasts_async(limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Get the most recently recorded podcasts without blocking the event loop.
+    
+    Args:
+        limit: Maximum number of podcasts to return
+        
+    Returns:
+        List of projected podcast documents, newest first
+    """
+    collection = get_async_podcast_collection()
+    projection = {**SEARCH_PROJECTION, "database_record_date": 1}
+    cursor = collection.find({}, projection).sort([("database_record_date", -1)]).limit(limit)
+    return await cursor.to_list(length=limit)
+
 # Schema definition (for documentation and validation)
 PODCAST_SCHEMA = {
     "episode_id": str,  # Unique identifier for the episode
@@ -52,6 +178,19 @@ PODCAST_SCHEMA = {
     "is_new": bool,  # Flag to mark as newly generated
 }
 
+class PodcastDoc(BaseModel):
+    """Validation model for podcast documents, compiled once by pydantic-core."""
+    model_config = ConfigDict(extra="allow")
+    
+    episode_id: str
+    podcast_title: str
+    podcast_url: str
+    podcast_summary: str
+    podcast_description: Optional[str] = None
+    length: Optional[str] = None
+    database_record_date: Optional[str] = None
+    is_new: Optional[bool] = None
+
 # Function to validate podcast documents against schema
 def validate_podcast_document(document: Dict[str, Any]) -> bool:
     """
@@ -63,21 +202,9 @@ def validate_podcast_document(document: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["episode_id", "podcast_title", "podcast_url", "podcast_summary"]
-    
-    # Check required fields
-    for field in required_fields:
-        if field not in document:
-            logger.error(f"Missing required field: {field}")
-            return False
-    
-    # Validate field types where possible
-    if not isinstance(document.get("episode_id", ""), str):
-        logger.error("episode_id must be a string")
-        return False
-        
-    if not isinstance(document.get("podcast_title", ""), str):
-        logger.error("podcast_title must be a string")
+    try:
+        PodcastDoc.model_validate(document)
+        return True
+    except ValidationError as e:
+        logger.error(str(e))
         return False
-    
-    return True
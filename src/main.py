@@ -1,42 +1,45 @@
 import os
 import sys
+import asyncio
 import logging
 import argparse
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 
 # Enable environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-# Import core components
-from langchain_core.messages import HumanMessage
-from langchain_core.runnables import RunnableConfig
+# Make the `src` package importable when this file is run directly
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
-# Import project modules (using proper project structure)
-try:
-    from src.agent import graph
-    from src.vectorstore import insert_to_vector_db, get_latest_podcast, sync_latest_podcasts
-except ImportError:
-    # Fallback for direct script execution
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from agent import graph
-    from vectorstore import insert_to_vector_db, get_latest_podcast, sync_latest_podcasts
+# LangChain, the agent graph and the vector store are imported lazily so that
+# commands which do not need them (e.g. `email`) start quickly
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
 
 # Configure logging
 logging.basicConfig(
-    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'WARNING')),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 # Default configuration with environment-based settings
 DEFAULT_RECURSION_LIMIT = int(os.getenv('LLM_RECURSION_LIMIT', '15'))
-DEFAULT_CONFIG = RunnableConfig(
-    recursion_limit=DEFAULT_RECURSION_LIMIT,
-    tags=["podcast-agent"]
-)
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '4'))
+DEFAULT_EMAIL_SUMMARY_LIMIT = int(os.getenv('EMAIL_SUMMARY_LIMIT', '10'))
+DEFAULT_EMAIL_SUMMARY_CONCURRENCY = int(os.getenv('EMAIL_SUMMARY_CONCURRENCY', '4'))
+DEFAULT_CONFIG: "RunnableConfig" = {
+    "recursion_limit": DEFAULT_RECURSION_LIMIT,
+    # Bounds the thread fan-out used when the agent calls several tools at once
+    "max_concurrency": int(os.getenv('TOOL_POOL', '16')),
+    "tags": ["podcast-agent"]
+}
 
-def generate_insights(query: str, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+def generate_insights(query: str, config: Optional["RunnableConfig"] = None) -> Dict[str, Any]:
     """
     Generate insights from podcasts based on the provided query.
     
@@ -49,7 +52,10 @@ def generate_insights(query: str, config: Optional[RunnableConfig] = None) -> Di
     """
     if not config:
         config = DEFAULT_CONFIG
-        
+    
+    from langchain_core.messages import HumanMessage
+    from src.agent import graph
+    
     try:
         messages = [HumanMessage(content=query)]
         logger.info(f"Generating insights for query: {query}")
@@ -62,6 +68,121 @@ def generate_insights(query: str, config: Optional[RunnableConfig] = None) -> Di
         logger.error(f"Error generating insights: {str(e)}", exc_info=True)
         raise
 
+async def agenerate_insights(query: str, config: Optional["RunnableConfig"] = None) -> Dict[str, Any]:
+    """
+    Async variant of `generate_insights` for use inside an event loop.
+    
+    Args:
+        query: Search query or topic for podcast analysis
+        config: Optional LangChain runnable configuration
+        
+    Returns:
+        Dict containing the agent's response events
+    """
+    if not config:
+        config = DEFAULT_CONFIG
+    
+    from langchain_core.messages import HumanMessage
+    from src.agent import graph
+    
+    try:
+        messages = [HumanMessage(content=query)]
+        logger.info(f"Generating insights for query: {query}")
+        
+        events = await graph.ainvoke({'messages': messages}, config=config)
+        logger.info("Successfully generated insights")
+        
+        return events
+    except Exception as e:
+        logger.error(f"Error generating insights: {str(e)}", exc_info=True)
+        raise
+
+async def agenerate_insights_batch(queries: List[str],
+                                   config: Optional["RunnableConfig"] = None) -> List[Dict[str, Any]]:
+    """
+    Generate insights for several queries concurrently.
+    
+    At most BATCH_CONCURRENCY agent runs are in flight at once. The limit is
+    applied across the batch, so each run keeps its own config, including the
+    tool fan-out bound in `max_concurrency`.
+    
+    Args:
+        queries: Search queries or topics for podcast analysis
+        config: Optional LangChain runnable configuration applied to every query
+        
+    Returns:
+        List of agent response events, one per query in the same order
+    """
+    semaphore = asyncio.Semaphore(DEFAULT_BATCH_CONCURRENCY)
+    
+    async def run(query: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await agenerate_insights(query, config)
+    
+    logger.info(f"Generating insights for {len(queries)} queries")
+    return await asyncio.gather(*(run(query) for query in queries))
+
+async def agenerate_email_digest(limit: int = DEFAULT_EMAIL_SUMMARY_LIMIT) -> Optional[str]:
+    """
+    Build a Markdown email digest of the most recent podcasts.
+    
+    Each podcast is condensed by its own LLM call; the calls run concurrently,
+    at most EMAIL_SUMMARY_CONCURRENCY at a time, so the digest takes roughly as
+    long as the slowest summary rather than the sum of all of them.
+    
+    Args:
+        limit: Number of recent podcasts to include
+        
+    Returns:
+        Markdown digest, or None if there are no podcasts to report
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from src.agent import chat_model
+    from src.db.schema import get_latest_podcasts_async
+    from src.prompts import EMAIL_DIGEST_PROMPT
+    
+    semaphore = asyncio.Semaphore(DEFAULT_EMAIL_SUMMARY_CONCURRENCY)
+    
+    podcasts = await get_latest_podcasts_async(limit)
+    if not podcasts:
+        logger.info("No podcasts found for the email digest")
+        return None
+    
+    async def summarize(podcast: Dict[str, Any]) -> str:
+        async with semaphore:
+            response = await chat_model.ainvoke([
+                SystemMessage(content=EMAIL_DIGEST_PROMPT),
+                HumanMessage(content=podcast.get('podcast_summary', ''))
+            ])
+        title = podcast.get('podcast_title', 'Untitled')
+        url = podcast.get('podcast_url')
+        heading = f"## [{title}]({url})" if url else f"## {title}"
+        return f"{heading}\n\n{response.content}"
+    
+    logger.info(f"Summarizing {len(podcasts)} podcasts for the email digest")
+    sections = await asyncio.gather(*(summarize(podcast) for podcast in podcasts))
+    return "# Latest AI Podcast Insights\n\n" + "\n\n".join(sections)
+
+async def asend_email_digest(limit: int = DEFAULT_EMAIL_SUMMARY_LIMIT) -> Dict[str, Any]:
+    """
+    Build the email digest of the most recent podcasts and send it to EMAIL_RECIPIENT.
+    
+    Args:
+        limit: Number of recent podcasts to include
+        
+    Returns:
+        Dict containing the send status; "skipped" when there are no podcasts
+    """
+    from src.utils import send_email
+    
+    message = await agenerate_email_digest(limit)
+    if not message:
+        logger.info("No podcasts to include in the email summary")
+        return {"status": "skipped", "message": "No podcasts to include"}
+    
+    subject = f"AI Podcast Insights Summary - {datetime.now().strftime('%Y-%m-%d')}"
+    return await asyncio.to_thread(send_email, message, subject)
+
 def sync_to_vector_db(podcast_limit: int = 1) -> Dict[str, Any]:
     """
     Sync the latest podcasts to the vector database.
@@ -76,6 +197,7 @@ def sync_to_vector_db(podcast_limit: int = 1) -> Dict[str, Any]:
         logger.info(f"Fetching {podcast_limit} latest podcasts for vector DB sync")
         
         # Use the enhanced sync function from the improved vectorstore module
+        from src.vectorstore import sync_latest_podcasts
         result = sync_latest_podcasts(podcast_limit)
         
         logger.info(f"Vector DB sync complete: {result['message']}")
@@ -95,8 +217,8 @@ def main():
     
     # Query command
     query_parser = subparsers.add_parser('query', help='Generate insights from podcasts')
-    query_parser.add_argument('--message', '-m', type=str, required=True,
-                                help='Query or topic to analyze')
+    query_parser.add_argument('--message', '-m', type=str, required=True, action='append',
+                                help='Query or topic to analyze (repeat to run several in parallel)')
     
     # Sync command
     sync_parser = subparsers.add_parser('sync', help='Sync podcasts to vector database')
@@ -127,27 +249,36 @@ def main():
     # Execute the appropriate command
     try:
         if args.command == 'query':
-            events = generate_insights(args.message)
-            print(f"Generated insights for query: '{args.message}'")
-            # Print the last event content for CLI usage
-            if events and events.get('messages'):
-                last_message = events['messages'][-1]
-                print("\nResponse:")
-                print(last_message.content)
+            if len(args.message) == 1:
+                results = [generate_insights(args.message[0])]
+            else:
+                results = asyncio.run(agenerate_insights_batch(args.message))
+            
+            for message, events in zip(args.message, results):
+                print(f"Generated insights for query: '{message}'")
+                # Print the last event content for CLI usage
+                if events and events.get('messages'):
+                    last_message = events['messages'][-1]
+                    print("\nResponse:")
+                    print(last_message.content)
                 
         elif args.command == 'sync':
             result = sync_to_vector_db(args.limit)
             print(f"Vector DB sync result: {result['message']}")
             
         elif args.command == 'email':
-            # This is a placeholder for the email functionality
-            # You would implement a function to generate and send an email
             recipient = args.recipient
             if not recipient:
                 logger.error("Email recipient not specified")
                 print("Error: Email recipient is required. Use --recipient or set EMAIL_RECIPIENT in .env")
                 sys.exit(1)
-            print(f"Email functionality would send to: {recipient}")
+            # send_email reads the recipient from the environment
+            os.environ["EMAIL_RECIPIENT"] = recipient
+            
+            result = asyncio.run(asend_email_digest())
+            print(f"Email summary for {recipient}: {result.get('status', 'unknown')}")
+            if result.get('status') == 'error':
+                sys.exit(1)
             
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
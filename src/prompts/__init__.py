@@ -4,7 +4,11 @@ Prompt Templates Module
 This module provides system prompts and templates for the podcast insight agent.
 """
 
-from .system_prompt import SUMMARIZER_SYSTEM_PROMPT
+from .system_prompt import (
+    SUMMARIZER_SYSTEM_PROMPT,
+    EMAIL_DIGEST_PROMPT,
+    get_system_prompt_token_count
+)
 
 # Export the system message for backward compatibility
 system_message = SUMMARIZER_SYSTEM_PROMPT
@@ -12,4 +16,6 @@ system_message = SUMMARIZER_SYSTEM_PROMPT
 __all__ = [
     'system_message',
     'SUMMARIZER_SYSTEM_PROMPT',
+    'EMAIL_DIGEST_PROMPT',
+    'get_system_prompt_token_count',
 ]
\ No newline at end of file
@@ -1,3 +1,6 @@
+import sys
+from functools import lru_cache
+
 # Main system prompt for the podcast summarizer agent
 SUMMARIZER_SYSTEM_PROMPT = (
     "ROLE: You are an autonomous ReAct-based AI Agent specialized in analyzing and summarizing recent AI-related YouTube content.\n\n"
@@ -80,6 +83,20 @@ SUMMARIZER_SYSTEM_PROMPT = (
     "✓ Proper contextualization within the AI landscape\n"
     "✓ Flawless Markdown formatting for end-user readability"
 )
+# Sent on every agent step; interned so all references share one object
+SUMMARIZER_SYSTEM_PROMPT = sys.intern(SUMMARIZER_SYSTEM_PROMPT)
+
+# Prompt used to condense one stored podcast summary for the email digest
+EMAIL_DIGEST_PROMPT = (
+    "ROLE: You are an AI analyst writing a short section of a weekly podcast digest email.\n\n"
+    "TASK: Condense the podcast summary provided by the user into:\n"
+    "- One sentence describing what the episode covers\n"
+    "- 3-5 bullet points with the most important insights, tools or resources\n\n"
+    "RULES:\n"
+    "- Use ONLY information from the provided summary\n"
+    "- Output Markdown without a heading; the title is added separately\n"
+    "- Keep the section under 150 words"
+)
 
 # You can add more specialized prompts for different agent roles here
 # For example:
@@ -92,3 +109,18 @@ YOUTUBE_FINDER_PROMPT = """
 ROLE: You are a specialized AI tool for finding the most relevant and informative AI YouTube content.
 ...
 """
+
+@lru_cache(maxsize=8)
+def get_system_prompt_token_count(model: str = "o4-mini") -> int:
+    """
+    Token count of SUMMARIZER_SYSTEM_PROMPT for a model, tokenized once.
+    
+    Computed on first use rather than at import, since loading a tiktoken
+    encoding may download it.
+    """
+    import tiktoken
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    return len(encoding.encode(SUMMARIZER_SYSTEM_PROMPT))
@@ -5,6 +5,18 @@ This module provides functionality for retrieving relevant podcast information
 and generating AI responses based on vector similarity search.
 """
 
-from .retriever import retrieve_and_respond, llm
+from .retriever import (
+    retrieve_and_respond,
+    retrieve_and_stream,
+    llm,
+    embeddings
+)
+from .semantic_cache import SemanticCache
 
-__all__ = ['retrieve_and_respond', 'llm']
+__all__ = [
+    'retrieve_and_respond',
+    'retrieve_and_stream',
+    'llm',
+    'embeddings',
+    'SemanticCache'
+]
@@ -0,0 +1,50 @@
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query embeddings keyed by the exact query string.
+
+    Complements the semantic cache: repeated identical queries (refreshes,
+    retries) skip the embedding API round-trip entirely. Vectors are stored as
+    tuples so cached values cannot be mutated by callers.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_entries: int = DEFAULT_QUERY_EMBEDDING_CACHE_SIZE):
+        self.embeddings = embeddings
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, query: str):
+        with self._lock:
+            vector = self._entries.get(query)
+            if vector is not None:
+                self._entries.move_to_end(query)
+            return vector
+
+    def _put(self, query: str, vector: List[float]) -> Tuple[float, ...]:
+        vector = tuple(vector)
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[query] = vector
+                self._entries.move_to_end(query)
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return vector
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a query, reusing the cached vector for a repeated string."""
+        vector = self._get(query)
+        if vector is None:
+            vector = self._put(query, self.embeddings.embed_query(query))
+        return list(vector)
+
+    def __len__(self) -> int:
+        return len(self._entries)
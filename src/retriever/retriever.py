@@ -1,82 +1,199 @@
-from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_pinecone import PineconeVectorStore
 from pinecone import Pinecone
 import os
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ._cache import QueryEmbeddingCache
+from .semantic_cache import SemanticCache
+
+# Pinecone and embedding settings, shared with vectorstore.pinecone_sync
+PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "podcast-summaries-1024")
+PINECONE_NAMESPACE = os.getenv("PINECONE_NAMESPACE", "summaries")
+TEXT_KEY = "text"  # metadata key holding the summary text
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
+# text-embedding-3-large truncated via the `dimensions` parameter (native size is 3072)
+EMBEDDING_DIMENSION = int(os.getenv("EMBEDDING_DIMENSION", "1024"))
 
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-index = pc.Index("podcast-summaries")
-embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
+index = pc.Index(PINECONE_INDEX_NAME)
+embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, dimensions=EMBEDDING_DIMENSION)
+query_embeddings = QueryEmbeddingCache(
+    embeddings,
+    max_entries=int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "4096"))
+)
 
 llm = ChatOpenAI(
     model="gpt-3.5-turbo",
-    temperature=0.7,
+    temperature=float(os.getenv("RETRIEVER_TEMPERATURE", "0.7")),
     api_key=os.getenv("OPENAI_API_KEY")
 )
 
-def retrieve_and_respond(query: str, llm, top_k: int = 5, min_score: float = 0.30):
-    vector_store = PineconeVectorStore(
-        index=index,
-        embedding=embeddings,
-        namespace="summaries"
+NO_RESULTS_RESPONSE = (
+    "I don't have enough information from the podcast database to answer "
+    "this question confidently. Could you try asking something related to "
+    "recent AI developments, tools, or insights from tech podcasts?"
+)
+
+# Answer prompt, filled with str.format; no LangChain template features are needed
+_PROMPT = (
+    "You are an expert AI analyst specializing in podcast content analysis.\n\n"
+    "Below are {source_count} relevant podcast summaries related to the user's question:\n\n"
+    "{context}\n\n"
+    "TASK: Answer the question below using ONLY information from these podcast summaries.\n"
+    "- Cite specific podcasts using [Title] format when referencing information\n"
+    "- If the information provided is insufficient, clearly state what's missing\n"
+    "- Maintain a neutral, analytical tone throughout\n"
+    "- Structure complex answers with bullet points when appropriate\n"
+    "- Do NOT fabricate information not present in the summaries\n\n"
+    "Question: {question}\n\n"
+    "Answer: "
+)
+
+class Match(NamedTuple):
+    page_content: str
+    metadata: dict
+    score: float
+
+def _query_index(query_vector: List[float], top_k: int) -> List[Match]:
+    # Query Pinecone directly; vector values are not needed, only text and metadata
+    response = index.query(
+        vector=query_vector,
+        top_k=top_k,
+        include_metadata=True,
+        include_values=False,
+        namespace=PINECONE_NAMESPACE
     )
+    results = []
+    for match in response.matches:
+        metadata = dict(match.metadata or {})
+        results.append(Match(metadata.pop(TEXT_KEY, ""), metadata, match.score))
+    return results
+
+# Semantic cache in front of retrieval: similar questions reuse the retrieved
+# documents, and near-identical ones reuse the answer when the LLM is
+# deterministic. "No results" answers are not cached, so a question asked
+# before its podcast is synced is answered once the podcast is indexed.
+SEMANTIC_CACHE_ANSWER_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_ANSWER_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_RETRIEVAL_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_RETRIEVAL_THRESHOLD", "0.85"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+semantic_cache = SemanticCache(
+    max_entries=int(os.getenv("SEMANTIC_CACHE_SIZE", "2048")),
+    dim=EMBEDDING_DIMENSION,
+    ttl=SEMANTIC_CACHE_TTL
+)
+
+class CacheEntry(NamedTuple):
+    results_with_scores: list  # best first, as returned for top_k
+    top_k: int
+    # The answer and what produced it; response is None when it is not reusable
+    response: Optional[str]
+    metadata_list: list
+    llm: object
+    min_score: float
+
+def _answer_cacheable(llm) -> bool:
+    # Sampled answers differ between calls, so only temperature 0 answers are reused
+    return getattr(llm, "temperature", None) == 0
 
-    # Direct similarity search with scores
-    results_with_scores = vector_store.similarity_search_with_score(query=query, k=top_k)
+def _cache_lookup(query_vector: List[float], llm, top_k: int, min_score: float):
+    # Returns (cached (response, metadata_list) or None, cached search results or None)
+    hit = semantic_cache.lookup(query_vector, SEMANTIC_CACHE_RETRIEVAL_THRESHOLD)
+    if hit is None:
+        return None, None
+    score, entry = hit
+    if entry.top_k < top_k:
+        return None, None
+    if (score >= SEMANTIC_CACHE_ANSWER_THRESHOLD and entry.response is not None
+            and entry.top_k == top_k and entry.llm is llm and entry.min_score == min_score):
+        return (entry.response, entry.metadata_list), None
+    return None, entry.results_with_scores[:top_k]
 
-    # Filter by score
-    high_score_docs = []
+def _cache_store(query_vector: List[float], results_with_scores, top_k: int, llm, min_score: float,
+                 response: str, metadata_list) -> None:
+    if not _answer_cacheable(llm):
+        response = None
+    semantic_cache.put(
+        query_vector,
+        CacheEntry(results_with_scores, top_k, response, metadata_list, llm, min_score)
+    )
+
+def _build_prompt(query: str, results_with_scores, min_score: float):
+    # Filter by score with a vectorized mask, then build the context and the
+    # sources footnote in one pass over the survivors
+    context_parts = []
+    source_parts = []
     metadata_list = []
 
-    for doc, score in results_with_scores:
-        if score >= min_score:
-            high_score_docs.append(doc)
-            metadata_list.append(doc.metadata)
-
-    context = "\n\n".join([
-        f"Title: {doc.metadata.get('podcast_title', '')}\nSummary:\n{doc.page_content}"
-        for doc in high_score_docs
-    ])
-
-    # Create a more comprehensive prompt template with better context handling
-    prompt_template = PromptTemplate(
-        input_variables=["context", "question", "source_count"],
-        template=(
-            "You are an expert AI analyst specializing in podcast content analysis.\n\n"
-            "Below are {source_count} relevant podcast summaries related to the user's question:\n\n"
-            "{context}\n\n"
-            "TASK: Answer the question below using ONLY information from these podcast summaries.\n"
-            "- Cite specific podcasts using [Title] format when referencing information\n"
-            "- If the information provided is insufficient, clearly state what's missing\n"
-            "- Maintain a neutral, analytical tone throughout\n"
-            "- Structure complex answers with bullet points when appropriate\n"
-            "- Do NOT fabricate information not present in the summaries\n\n"
-            "Question: {question}\n\n"
-            "Answer: "
-        )
+    scores = np.fromiter(
+        (match.score for match in results_with_scores),
+        dtype=np.float32,
+        count=len(results_with_scores)
     )
+    for i in np.flatnonzero(scores >= min_score):
+        page_content, metadata, _ = results_with_scores[i]
+        title = metadata.get('podcast_title', 'Untitled')
+        context_parts.append(f"Title: {title}\nSummary:\n{page_content}")
+        source_parts.append(f"- {title} ({metadata.get('podcast_url', 'No URL')})")
+        metadata_list.append(metadata)
 
     # Handle empty results case
-    if not high_score_docs:
-        return ("I don't have enough information from the podcast database to answer "
-                "this question confidently. Could you try asking something related to "
-                "recent AI developments, tools, or insights from tech podcasts?"), []
-
-    # Format the response with improved prompt
-    final_prompt = prompt_template.format(
-        context=context, 
+    if not context_parts:
+        return None, "", metadata_list
+
+    final_prompt = _PROMPT.format(
+        context="\n\n".join(context_parts),
         question=query,
-        source_count=len(high_score_docs)
+        source_count=len(context_parts)
     )
-    
-    response_content = llm.invoke(final_prompt).content
-    
-    # Add a footnote with sources if we have results
-    if high_score_docs:
-        source_list = "\n\n**Sources:**\n" + "\n".join([
-            f"- {doc.metadata.get('podcast_title', 'Untitled')} ({doc.metadata.get('podcast_url', 'No URL')})"
-            for doc in high_score_docs
-        ])
-        response_content += source_list
-        
-    return response_content, metadata_list
\ No newline at end of file
+    sources = "\n\n**Sources:**\n" + "\n".join(source_parts)
+    return final_prompt, sources, metadata_list
+
+def retrieve_and_respond(query: str, llm, top_k: int = 5, min_score: float = 0.30) -> Tuple[str, List[dict]]:
+    # Embed once; the vector serves the cache lookup and the similarity search
+    query_vector = query_embeddings.embed_query(query)
+    cached_answer, results_with_scores = _cache_lookup(query_vector, llm, top_k, min_score)
+    if cached_answer is not None:
+        return cached_answer
+
+    if results_with_scores is None:
+        results_with_scores = _query_index(query_vector, top_k)
+
+    final_prompt, sources, metadata_list = _build_prompt(query, results_with_scores, min_score)
+    if final_prompt is None:
+        return NO_RESULTS_RESPONSE, metadata_list
+
+    response_content = llm.invoke(final_prompt).content + sources
+    _cache_store(query_vector, results_with_scores, top_k, llm, min_score, response_content, metadata_list)
+    return response_content, metadata_list
+
+def retrieve_and_stream(query: str, llm, top_k: int = 5, min_score: float = 0.30) -> Tuple[Iterator[str], List[dict]]:
+    # Returns (token iterator, metadata_list); tokens arrive as the LLM produces
+    # them and the sources footnote is the final item
+    query_vector = query_embeddings.embed_query(query)
+    cached_answer, results_with_scores = _cache_lookup(query_vector, llm, top_k, min_score)
+    if cached_answer is not None:
+        response_content, metadata_list = cached_answer
+        return iter([response_content]), metadata_list
+
+    # Retrieval completes up front so metadata is known before streaming starts
+    if results_with_scores is None:
+        results_with_scores = _query_index(query_vector, top_k)
+
+    final_prompt, sources, metadata_list = _build_prompt(query, results_with_scores, min_score)
+    if final_prompt is None:
+        return iter([NO_RESULTS_RESPONSE]), []
+
+    def stream() -> Iterator[str]:
+        parts = []
+        for chunk in llm.stream(final_prompt):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        # The sources footnote follows the streamed answer
+        yield sources
+        _cache_store(query_vector, results_with_scores, top_k, llm, min_score,
+                     "".join(parts) + sources, metadata_list)
+
+    return stream(), metadata_list
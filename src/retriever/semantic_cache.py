@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-process cache of values keyed by query embedding similarity.
+
+    Embeddings are L2-normalized and stored as float16 rows of a fixed-capacity
+    matrix, so a lookup is one matrix-vector product followed by an argmax, over
+    half the memory of float32. Entries older than the TTL are invisible to
+    lookups and are the first to be reused on insert; a query that is
+    near-identical to a cached one overwrites it in place. Otherwise, when the
+    cache is full, the least recently used entry is overwritten. Callers embed
+    the query themselves, which lets one vector serve the lookup, the insertion
+    and the vector store query.
+    """
+
+    def __init__(self, max_entries: int = 2048, dim: Optional[int] = None,
+                 ttl: Optional[float] = None, duplicate_threshold: float = 0.999):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.duplicate_threshold = duplicate_threshold
+        # Preallocated when the dimension is known, otherwise on first insert
+        self._matrix: Optional[np.ndarray] = None
+        if dim and max_entries > 0:
+            self._matrix = np.empty((max_entries, dim), dtype=np.float16)
+        self._values: List[Any] = []
+        self._last_used = np.zeros(max(max_entries, 0), dtype=np.int64)
+        self._inserted_at = np.zeros(max(max_entries, 0), dtype=np.float64)
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _touch(self, slot: int) -> None:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    def _expired(self, count: int) -> np.ndarray:
+        if self.ttl is None:
+            return np.zeros(count, dtype=bool)
+        return time.monotonic() - self._inserted_at[:count] > self.ttl
+
+    def _scores(self, query: np.ndarray, count: int) -> np.ndarray:
+        return self._matrix[:count].astype(np.float32) @ query
+
+    def lookup(self, vector: Sequence[float], threshold: float) -> Optional[Tuple[float, Any]]:
+        """
+        Find the most similar live cached query.
+
+        Returns:
+            (cosine similarity, value) for the best unexpired match at or above
+            the threshold, or None
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            count = len(self._values)
+            if not count:
+                return None
+            scores = self._scores(query, count)
+            scores[self._expired(count)] = -np.inf
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            if score < threshold:
+                return None
+            self._touch(best)
+            return score, self._values[best]
+
+    def put(self, vector: Sequence[float], value: Any) -> None:
+        """
+        Cache a value.
+
+        Reuses, in order of preference: the slot of a near-identical query, an
+        expired slot, a free slot, then the least recently used slot.
+        """
+        if self.max_entries <= 0:
+            return
+        row = self._normalize(vector)
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.empty((self.max_entries, row.shape[0]), dtype=np.float16)
+
+            count = len(self._values)
+            slot = None
+            if count:
+                scores = self._scores(row, count)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.duplicate_threshold:
+                    slot = best
+                else:
+                    expired = np.flatnonzero(self._expired(count))
+                    if expired.size:
+                        slot = int(expired[0])
+
+            if slot is None and count < self.max_entries:
+                slot = count
+                self._values.append(value)
+            else:
+                if slot is None:
+                    slot = int(np.argmin(self._last_used))
+                self._values[slot] = value
+
+            self._matrix[slot] = row.astype(np.float16)
+            self._inserted_at[slot] = time.monotonic()
+            self._touch(slot)
+
+    def __len__(self) -> int:
+        return len(self._values)
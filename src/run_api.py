@@ -6,14 +6,30 @@ from dotenv import load_dotenv
 load_dotenv()
 
 if __name__ == "__main__":
-    # Import here to ensure environment variables are loaded first
-    from src.api import create_app
-    
     # Set host and port from environment or use defaults
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
     debug = os.getenv("FLASK_DEBUG", "False").lower() in ("true", "1", "t")
-    
+
     print(f"Starting Podcast Insight Agent API on {host}:{port}")
-    app = create_app()
-    app.run(host=host, port=port, debug=debug)
+
+    if debug:
+        # Import here to ensure environment variables are loaded first
+        from src.api import create_app
+
+        app = create_app()
+        app.run(host=host, port=port, debug=debug)
+    else:
+        # Flask is a WSGI app, so use threaded gunicorn workers to overlap
+        # requests that are waiting on LLM and vector DB I/O
+        workers = int(os.getenv("API_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+        threads = int(os.getenv("API_THREADS", "4"))
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "--worker-class", "gthread",
+            "--workers", str(workers),
+            "--threads", str(threads),
+            "--timeout", "120",
+            "--bind", f"{host}:{port}",
+            "src.api:create_app()"
+        ])
@@ -1,6 +1,9 @@
 import os
 import sys
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import argparse
 from datetime import datetime
 from dotenv import load_dotenv
@@ -8,23 +11,35 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Ensure logs directory exists before the file handler opens its log file
+os.makedirs("logs", exist_ok=True)
+
+# Configure logging; file writes are buffered and flushed in batches, on
+# errors, and at exit
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+file_handler = logging.FileHandler(os.path.join("logs", f"scheduled_job_{datetime.now().strftime('%Y%m%d')}.log"))
+# Flushed records are formatted by the target, not by the MemoryHandler
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+buffered_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=file_handler
+)
+atexit.register(buffered_handler.flush)
+
 logging.basicConfig(
-    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'WARNING')),
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(os.path.join("logs", f"scheduled_job_{datetime.now().strftime('%Y%m%d')}.log")),
+        buffered_handler,
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
-# Ensure logs directory exists
-os.makedirs("logs", exist_ok=True)
-
-def run_podcast_discovery():
+async def run_podcast_discovery():
     """Find and analyze new podcasts."""
-    from src.main import generate_insights
+    from src.main import agenerate_insights
     
     # Default search query from environment or use a reasonable default
     query = os.getenv("PODCAST_SEARCH_QUERY", "latest AI advancements podcast")
@@ -32,14 +47,14 @@ def run_podcast_discovery():
     logger.info(f"Running scheduled podcast discovery with query: {query}")
     
     try:
-        result = generate_insights(query)
+        result = await agenerate_insights(query)
         logger.info("Podcast discovery completed successfully")
         return True
     except Exception as e:
         logger.error(f"Error during podcast discovery: {str(e)}", exc_info=True)
         return False
 
-def run_vector_sync():
+async def run_vector_sync():
     """Sync recent podcasts to vector database."""
     from src.main import sync_to_vector_db
     
@@ -49,17 +64,16 @@ def run_vector_sync():
     logger.info(f"Running scheduled vector DB sync for {sync_limit} podcasts")
     
     try:
-        result = sync_to_vector_db(sync_limit)
+        result = await asyncio.to_thread(sync_to_vector_db, sync_limit)
         logger.info(f"Vector sync completed: {result['message']}")
         return result["status"] == "success"
     except Exception as e:
         logger.error(f"Error during vector sync: {str(e)}", exc_info=True)
         return False
 
-def run_email_summary():
+async def run_email_summary():
     """Generate and send email summary of recent podcasts."""
-    # This would call your email functionality
-    from src.utils import send_email
+    from src.main import asend_email_digest
     
     # Get recipient from environment
     recipient = os.getenv("EMAIL_RECIPIENT")
@@ -70,19 +84,43 @@ def run_email_summary():
     logger.info(f"Generating email summary for {recipient}")
     
     try:
-        # Generate summary and send email
-        # This is a simplified example - you would need to implement the actual summary generation
-        subject = f"AI Podcast Insights Summary - {datetime.now().strftime('%Y-%m-%d')}"
-        message = "# Latest AI Podcast Insights\n\nThis is a placeholder for your automated podcast summary."
-        
-        # This assumes your send_email has been updated to return a status dictionary
-        result = send_email(message, subject)
+        # Summaries of the latest podcasts are generated concurrently
+        result = await asend_email_digest()
         logger.info(f"Email summary sent: {result.get('status', 'unknown')}")
-        return True
+        return result.get('status') in ('success', 'skipped')
     except Exception as e:
         logger.error(f"Error sending email summary: {str(e)}", exc_info=True)
         return False
 
+async def run_jobs(jobs) -> list:
+    """
+    Run jobs, returning one result (or exception) per job in the given order.
+    
+    Sync and email read the podcasts that discovery writes, so discovery runs
+    first and its queued MongoDB inserts are drained before the remaining
+    jobs start. Those run concurrently, at most JOB_CONCURRENCY at a time.
+    """
+    from src.utils import wait_for_pending_inserts
+    
+    results = {}
+    if run_podcast_discovery in jobs:
+        try:
+            results[run_podcast_discovery] = await run_podcast_discovery()
+        except Exception as e:
+            results[run_podcast_discovery] = e
+        await asyncio.to_thread(wait_for_pending_inserts)
+    
+    semaphore = asyncio.Semaphore(int(os.getenv("JOB_CONCURRENCY", "2")))
+    
+    async def guarded(job):
+        async with semaphore:
+            return await job()
+    
+    followers = [job for job in jobs if job is not run_podcast_discovery]
+    outcomes = await asyncio.gather(*(guarded(job) for job in followers), return_exceptions=True)
+    results.update(zip(followers, outcomes))
+    return [results[job] for job in jobs]
+
 def main():
     """Run all scheduled jobs or a specific job."""
     parser = argparse.ArgumentParser(description='Run scheduled jobs for Podcast Insight Agent')
@@ -92,14 +130,19 @@ def main():
     args = parser.parse_args()
     
     # Run the specified job(s)
+    jobs = []
     if args.job in ('all', 'discover'):
-        run_podcast_discovery()
+        jobs.append(run_podcast_discovery)
     
     if args.job in ('all', 'sync'):
-        run_vector_sync()
+        jobs.append(run_vector_sync)
     
     if args.job in ('all', 'email'):
-        run_email_summary()
+        jobs.append(run_email_summary)
+    
+    for job, result in zip(jobs, asyncio.run(run_jobs(jobs))):
+        if isinstance(result, Exception):
+            logger.error(f"Job {job.__name__} raised: {str(result)}")
 
 if __name__ == "__main__":
     logger.info("Starting scheduled jobs")
@@ -11,6 +11,7 @@ from .tools import (
     get_today_date, 
     send_email,
     insert_to_mongodb,
+    wait_for_pending_inserts,
     tools
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     'get_today_date',
     'send_email',
     'insert_to_mongodb',
+    'wait_for_pending_inserts',
     'tools'
 ]
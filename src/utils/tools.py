@@ -1,9 +1,19 @@
 import datetime
 import logging
 import os
+import shelve
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Any
 
 import markdown2
+try:
+    # C implementation of GitHub Flavored Markdown, much faster than markdown2
+    import cmarkgfm
+except ImportError:
+    cmarkgfm = None
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 from serpapi import GoogleSearch
@@ -11,9 +21,13 @@ from langchain_community.tools import GmailSendMessage
 from langchain_community.agent_toolkits import GmailToolkit
 from langchain_community.tools.gmail.utils import build_resource_service
 from google.oauth2.credentials import Credentials
-from pymongo.mongo_client import MongoClient
-from pymongo.server_api import ServerApi
 from pymongo.errors import ConnectionFailure, PyMongoError
+from pymongo.write_concern import WriteConcern
+
+try:
+    from src.db.schema import get_db_connection
+except ImportError:
+    from db.schema import get_db_connection
 
 # Set up logging
 logging.basicConfig(
@@ -36,16 +50,43 @@ creds = Credentials(
 api_resource = build_resource_service(credentials=creds)
 toolkit = GmailToolkit(api_resource=api_resource)
 
-# MongoDB connection pool
+# Built once and reused by send_email
+_GMAIL_SEND_TOOL = GmailSendMessage(api_resource=api_resource)
+_MD = markdown2.Markdown()
+
+def _markdown_to_html(message: str) -> str:
+    """Render email Markdown to HTML, preferring cmarkgfm when installed."""
+    if cmarkgfm is not None:
+        return cmarkgfm.github_flavored_markdown_to_html(message)
+    return _MD.convert(message)
+
+# MongoDB connection pool, shared with the rest of the process
 try:
-    mongo_client = MongoClient(os.getenv("mongodb_uri"), server_api=ServerApi("1"))
+    mongo_client = get_db_connection()
     # Test the connection
     mongo_client.admin.command('ping')
     logger.info("MongoDB connection established successfully")
-except ConnectionFailure as e:
+except (ConnectionFailure, EnvironmentError) as e:
     logger.error(f"MongoDB connection failed: {str(e)}")
     mongo_client = None
 
+# Summary writes are acknowledged by the primary without waiting for the journal,
+# and run on background threads so the agent does not wait on them
+_SUMMARY_WRITE_CONCERN = WriteConcern(w=1, j=False)
+_INSERT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mongo-insert")
+_pending_inserts: "set[Future]" = set()
+_pending_inserts_lock = threading.Lock()
+
+def wait_for_pending_inserts(timeout: Optional[float] = None) -> None:
+    """Block until every queued MongoDB insert has finished (or timeout)."""
+    with _pending_inserts_lock:
+        pending = list(_pending_inserts)
+    wait(pending, timeout=timeout)
+
+def _forget_insert(future: Future) -> None:
+    with _pending_inserts_lock:
+        _pending_inserts.discard(future)
+
 def search(search_query: str, custom_tbs: str = "cdr:1,cd_min:4/6/2025,cd_max:4/21/2025,sbd:1") -> Dict[str, Any]:
     """
     Search for specific podcasts using Google Search API.
@@ -74,6 +115,40 @@ def search(search_query: str, custom_tbs: str = "cdr:1,cd_min:4/6/2025,cd_max:4/
         logger.error(f"Search error: {str(e)}")
         return {"status": "error", "error": str(e)}
 
+# Transcripts never change for a given video, so they are cached indefinitely:
+# in memory for this process and on disk across runs
+TRANSCRIPT_CACHE_PATH = os.getenv(
+    "TRANSCRIPT_CACHE_PATH", os.path.join(tempfile.gettempdir(), "yt_transcripts")
+)
+_transcript_cache_lock = threading.Lock()
+
+def _read_cached_transcript(youtube_id: str) -> Optional[str]:
+    with _transcript_cache_lock:
+        try:
+            with shelve.open(TRANSCRIPT_CACHE_PATH) as cache:
+                return cache.get(youtube_id)
+        except Exception as e:
+            logger.warning(f"Transcript cache read failed: {str(e)}")
+            return None
+
+def _write_cached_transcript(youtube_id: str, text: str) -> None:
+    with _transcript_cache_lock:
+        try:
+            with shelve.open(TRANSCRIPT_CACHE_PATH) as cache:
+                cache[youtube_id] = text
+        except Exception as e:
+            logger.warning(f"Transcript cache write failed: {str(e)}")
+
+@lru_cache(maxsize=256)
+def _get_transcript_text(youtube_id: str) -> str:
+    """Fetch a video's transcript text, using the disk cache when possible."""
+    text = _read_cached_transcript(youtube_id)
+    if text is None:
+        transcriptions = YouTubeTranscriptApi.get_transcript(youtube_id)
+        text = ' '.join(segment["text"] for segment in transcriptions)
+        _write_cached_transcript(youtube_id, text)
+    return text
+
 def transcribe(youtube_id: str) -> Dict[str, Any]:
     """
     Transcribe a YouTube video.
@@ -85,10 +160,7 @@ def transcribe(youtube_id: str) -> Dict[str, Any]:
         Dict containing the transcription text or error information
     """
     try:
-        transcriptions = YouTubeTranscriptApi.get_transcript(youtube_id)
-        all_text = [x["text"] for x in transcriptions]
-        all_text = ' '.join(all_text)
-        return {"text": all_text, "status": "success"}
+        return {"text": _get_transcript_text(youtube_id), "status": "success"}
     except (TranscriptsDisabled, NoTranscriptFound) as e:
         logger.warning(f"Transcript not available for video {youtube_id}: {str(e)}")
         return {"status": "error", "error": f"Transcript not available: {str(e)}"}
@@ -118,9 +190,8 @@ def send_email(message: str, subject: str) -> Dict[str, Any]:
     """
     try:
         recipient = os.getenv("EMAIL_RECIPIENT", "omaratef3221@gmail.com")
-        html_content = markdown2.markdown(message)
-        tool = GmailSendMessage(api_resource=api_resource)
-        result = tool.run({
+        html_content = _markdown_to_html(message)
+        result = _GMAIL_SEND_TOOL.run({
             "to": recipient,
             "subject": subject,
             "message": html_content,
@@ -153,8 +224,11 @@ def insert_to_mongodb(
         length: Duration of the episode in HH:MM or MM:SS format
         is_new: Flag to mark the record as newly generated (default: True)
     
+    The write happens in the background; the tool returns as soon as the
+    record is queued.
+
     Returns:
-        Dict containing status information about the database operation
+        Dict containing status information about the queued operation
 
     Example inserted document:
         {
@@ -173,35 +247,44 @@ def insert_to_mongodb(
         logger.error("MongoDB client is not initialized")
         return {"status": "error", "error": "MongoDB connection not available"}
     
+    record = {
+        "episode_id": episode_id,
+        "podcast_title": podcast_title,
+        "podcast_description": podcast_description,
+        "podcast_url": podcast_url,
+        "podcast_summary": podcast_summary,
+        "length": length,
+        "database_record_date": datetime.datetime.now().isoformat(),
+        "is_new": is_new,
+        "message": "Podcast summary successfully generated and stored in Mongo Database"
+    }
+    
     try:
-        db = mongo_client.podcast_agent_results
-        collection = db.podcast_summaries
-
-        record = {
+        future = _INSERT_EXECUTOR.submit(_do_insert, record)
+        with _pending_inserts_lock:
+            _pending_inserts.add(future)
+        future.add_done_callback(_forget_insert)
+        return {
+            "status": "queued",
             "episode_id": episode_id,
-            "podcast_title": podcast_title,
-            "podcast_description": podcast_description,
-            "podcast_url": podcast_url,
-            "podcast_summary": podcast_summary,
-            "length": length,
-            "database_record_date": datetime.datetime.now().isoformat(),
-            "is_new": is_new,
-            "message": "Podcast summary successfully generated and stored in Mongo Database"
+            "message": "Podcast summary queued for storage"
         }
+    except Exception as e:
+        logger.error(f"Unexpected error while queuing database operation: {str(e)}")
+        return {"status": "error", "error": f"Unexpected error: {str(e)}"}
 
+def _do_insert(record: Dict[str, Any]) -> None:
+    """Insert a podcast record on a background thread, logging the outcome."""
+    try:
+        collection = mongo_client.podcast_agent_results.get_collection(
+            "podcast_summaries", write_concern=_SUMMARY_WRITE_CONCERN
+        )
         result = collection.insert_one(record)
         logger.info(f"Successfully inserted document with ID: {result.inserted_id}")
-        return {
-            "status": "success", 
-            "inserted_id": str(result.inserted_id),
-            "message": "Podcast summary stored successfully"
-        }
     except PyMongoError as e:
-        logger.error(f"MongoDB operation error: {str(e)}")
-        return {"status": "error", "error": f"Database error: {str(e)}"}
+        logger.error(f"MongoDB operation error for episode {record['episode_id']}: {str(e)}")
     except Exception as e:
         logger.error(f"Unexpected error during database operation: {str(e)}")
-        return {"status": "error", "error": f"Unexpected error: {str(e)}"}
 
 # List of available tools
 tools = [search, transcribe, get_today_date, send_email, insert_to_mongodb]
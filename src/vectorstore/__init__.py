@@ -9,6 +9,7 @@ from .pinecone_sync import (
     get_latest_podcast,
     insert_to_vector_db,
     sync_latest_podcasts,
+    sync_latest_podcasts_async,
     semantic_search
 )
 
@@ -16,5 +17,6 @@ __all__ = [
     'get_latest_podcast',
     'insert_to_vector_db', 
     'sync_latest_podcasts',
+    'sync_latest_podcasts_async',
     'semantic_search'
 ]
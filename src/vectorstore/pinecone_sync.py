@@ -1,17 +1,48 @@
 import os
+import asyncio
+import hashlib
 import logging
-import time
-from typing import Dict, Any, List, Optional, Iterator, Union
+from itertools import islice
+from typing import Dict, Any, List, Optional, Iterator, Tuple, Union
 
-from pymongo import MongoClient
-from pymongo.server_api import ServerApi
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from pymongo.errors import ConnectionFailure, PyMongoError
-from pinecone import Pinecone, ServerlessSpec
+from tenacity import retry, stop_after_attempt, wait_random_exponential
+from pinecone import ServerlessSpec
 from pinecone.core.exceptions import PineconeException
-from langchain_pinecone import PineconeVectorStore
-from langchain_openai import OpenAIEmbeddings
 from langchain.docstore.document import Document
 
+# The Pinecone index handle, embedding client and query-embedding cache are
+# shared with the retriever rather than created a second time
+try:
+    from src.db.schema import get_db_connection, get_podcast_collection
+    from src.retriever.retriever import (
+        EMBEDDING_DIMENSION,
+        EMBEDDING_MODEL,
+        PINECONE_INDEX_NAME,
+        PINECONE_NAMESPACE,
+        TEXT_KEY,
+        embeddings,
+        index,
+        pc,
+        query_embeddings,
+        _query_index
+    )
+except ImportError:
+    from db.schema import get_db_connection, get_podcast_collection
+    from retriever.retriever import (
+        EMBEDDING_DIMENSION,
+        EMBEDDING_MODEL,
+        PINECONE_INDEX_NAME,
+        PINECONE_NAMESPACE,
+        TEXT_KEY,
+        embeddings,
+        index,
+        pc,
+        query_embeddings,
+        _query_index
+    )
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,32 +51,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Configuration with environment variable fallbacks
-MONGODB_URI = os.getenv("mongodb_uri")
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "podcast-summaries")
-PINECONE_NAMESPACE = os.getenv("PINECONE_NAMESPACE", "summaries")
 PINECONE_CLOUD = os.getenv("PINECONE_CLOUD", "aws")
 PINECONE_REGION = os.getenv("PINECONE_REGION", "us-east-1")
-EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
-EMBEDDING_DIMENSION = 3072  # text-embedding-3-large dimension
+UPSERT_BATCH_SIZE = int(os.getenv("PINECONE_UPSERT_BATCH_SIZE", "100"))
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+SYNC_CONCURRENCY = int(os.getenv("SYNC_CONCURRENCY", "8"))
+HASH_KEY = "embedding_hash"  # content hash, used as the vector ID and stored in Mongo
+# Mixed into every content hash so that changing the target index or embedding
+# settings invalidates hashes recorded against the old ones
+EMBEDDING_HASH_PREFIX = f"{PINECONE_INDEX_NAME}|{PINECONE_NAMESPACE}|{EMBEDDING_MODEL}|{EMBEDDING_DIMENSION}|"
 
-# Initialize MongoDB connection
+# Newest-first sort for get_latest_podcast, served by walking the ascending
+# database_record_date index (created in db.schema) backwards, and the fields
+# the sync needs
+LATEST_SORT = [("database_record_date", DESCENDING)]
+LATEST_HINT = [("database_record_date", ASCENDING)]
+LATEST_PROJECTION = {
+    "_id": 0,
+    "episode_id": 1,
+    "podcast_title": 1,
+    "podcast_description": 1,
+    "podcast_url": 1,
+    "podcast_summary": 1,
+    "length": 1,
+    "database_record_date": 1,
+    "is_new": 1,
+    HASH_KEY: 1
+}
+
+# Initialize MongoDB connection, shared with the rest of the process
 try:
-    mongo_client = MongoClient(MONGODB_URI, server_api=ServerApi("1"))
+    mongo_client = get_db_connection()
     # Test connection
     mongo_client.admin.command('ping')
     logger.info("MongoDB connection established successfully")
-    db = mongo_client.podcast_agent_results
-    collection = db.podcast_summaries
-except ConnectionFailure as e:
+    collection = get_podcast_collection()
+except (ConnectionFailure, EnvironmentError) as e:
     logger.error(f"MongoDB connection failed: {str(e)}")
     mongo_client = None
-    db = None
     collection = None
 
-# Initialize Pinecone connection and create index if needed
+# Create the Pinecone index if needed
 try:
-    pc = Pinecone(api_key=PINECONE_API_KEY)
     spec = ServerlessSpec(cloud=PINECONE_CLOUD, region=PINECONE_REGION)
     
     # Check if index exists, create if not
@@ -62,17 +109,12 @@ try:
     else:
         logger.info(f"Using existing Pinecone index: {PINECONE_INDEX_NAME}")
     
-    # Initialize embeddings model
-    embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
-    
 except PineconeException as e:
     logger.error(f"Pinecone initialization error: {str(e)}")
     pc = None
-    embeddings = None
 except Exception as e:
     logger.error(f"Error during initialization: {str(e)}")
     pc = None
-    embeddings = None
 
 def get_latest_podcast(limit: int = 1) -> Iterator[Dict[str, Any]]:
     """
@@ -92,7 +134,14 @@ def get_latest_podcast(limit: int = 1) -> Iterator[Dict[str, Any]]:
             logger.error("MongoDB client is not initialized")
             return []
             
-        latest_podcasts = collection.find().sort([("database_record_date", -1)]).limit(limit)
+        # Projection skips transcripts and other large fields on the wire
+        latest_podcasts = (
+            collection.find({}, projection=LATEST_PROJECTION)
+            .sort(LATEST_SORT)
+            .limit(limit)
+            .hint(LATEST_HINT)
+            .batch_size(EMBEDDING_BATCH_SIZE)
+        )
         return latest_podcasts
     except PyMongoError as e:
         logger.error(f"Error retrieving latest podcasts: {str(e)}")
@@ -119,9 +168,16 @@ def prepare_document(podcast: Dict[str, Any]) -> Optional[Document]:
             if k not in {"_id", "podcast_summary", "podcast_transcript"}
         }
         
+        # Identical summaries hash to the same vector ID, so unchanged content
+        # never needs to be embedded twice for the same index and model
+        page_content = podcast["podcast_summary"]
+        metadata[HASH_KEY] = hashlib.blake2b(
+            (EMBEDDING_HASH_PREFIX + page_content).encode(), digest_size=16
+        ).hexdigest()
+        
         # Create document with podcast summary as content
         return Document(
-            page_content=podcast["podcast_summary"],
+            page_content=page_content,
             metadata=metadata
         )
     except KeyError as e:
@@ -131,16 +187,170 @@ def prepare_document(podcast: Dict[str, Any]) -> Optional[Document]:
         logger.error(f"Error preparing document: {str(e)}")
         return None
 
-def insert_to_vector_db(podcast: Dict[str, Any], 
-                        retry_attempts: int = 3, 
-                        retry_delay: float = 2.0) -> bool:
+def _to_vector_records(docs: List[Document], vectors: List[List[float]]) -> List[Dict[str, Any]]:
+    """
+    Build Pinecone upsert records, with the summary text stored in metadata.
+    
+    Records are keyed by the content hash so re-syncing an unchanged summary
+    overwrites its vector instead of adding a duplicate.
+    """
+    records = []
+    for doc, vector in zip(docs, vectors):
+        # Pinecone rejects null metadata values
+        metadata = {k: v for k, v in doc.metadata.items() if v is not None}
+        metadata[TEXT_KEY] = doc.page_content
+        records.append({
+            "id": doc.metadata[HASH_KEY],
+            "values": vector,
+            "metadata": metadata
+        })
+    return records
+
+# Exponential backoff with full jitter, so concurrent retries do not line up
+_PINECONE_RETRY = dict(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, max=8),
+    reraise=True
+)
+
+@retry(**_PINECONE_RETRY)
+def _fetch_existing_ids(ids: List[str]) -> set:
+    """Return the subset of vector IDs already present in the namespace."""
+    existing = set()
+    for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+        response = index.fetch(ids=ids[i:i + UPSERT_BATCH_SIZE], namespace=PINECONE_NAMESPACE)
+        existing.update(response.vectors)
+    return existing
+
+@retry(**_PINECONE_RETRY)
+def _delete_vectors(ids: List[str]) -> None:
+    """Delete vectors by ID, e.g. those of summaries that have since changed."""
+    for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+        index.delete(ids=ids[i:i + UPSERT_BATCH_SIZE], namespace=PINECONE_NAMESPACE)
+
+def _record_embedding_hashes(docs: List[Document]) -> None:
+    """Store each document's content hash on its Mongo record."""
+    updates = [
+        UpdateOne({"episode_id": doc.metadata["episode_id"]}, {"$set": {HASH_KEY: doc.metadata[HASH_KEY]}})
+        for doc in docs if doc.metadata.get("episode_id")
+    ]
+    if not updates:
+        return
+    try:
+        collection.bulk_write(updates, ordered=False)
+    except PyMongoError as e:
+        logger.warning(f"Failed to record embedding hashes: {str(e)}")
+
+@retry(**_PINECONE_RETRY)
+def _embed_and_upsert(docs: List[Document]) -> None:
+    """Embed documents in one request and upsert them in batches."""
+    vectors = embeddings.embed_documents([doc.page_content for doc in docs])
+    index.upsert(
+        vectors=_to_vector_records(docs, vectors),
+        namespace=PINECONE_NAMESPACE,
+        batch_size=UPSERT_BATCH_SIZE
+    )
+
+@retry(**_PINECONE_RETRY)
+async def _aembed_and_upsert(docs: List[Document]) -> None:
+    """Async variant of `_embed_and_upsert`; backoff waits with asyncio.sleep."""
+    vectors = await embeddings.aembed_documents([doc.page_content for doc in docs])
+    # The Pinecone client is synchronous; keep the event loop free
+    await asyncio.to_thread(
+        index.upsert,
+        vectors=_to_vector_records(docs, vectors),
+        namespace=PINECONE_NAMESPACE,
+        batch_size=UPSERT_BATCH_SIZE
+    )
+
+def _upsert_documents(docs: List[Document], retry_attempts: int = 3) -> bool:
+    """
+    Embed and upsert documents as one batch, retrying the whole batch on failure.
+    
+    Args:
+        docs: Documents to vectorize
+        retry_attempts: Number of attempts before giving up
+        
+    Returns:
+        Success status as boolean
+    """
+    try:
+        _embed_and_upsert.retry_with(stop=stop_after_attempt(retry_attempts))(docs)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to insert {len(docs)} podcast(s) into vector database after {retry_attempts} attempts: {str(e)}")
+        return False
+
+async def _sync_chunk(podcasts: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> Tuple[int, int]:
+    """
+    Embed and upsert one chunk of podcasts, releasing its semaphore slot when done.
+    
+    Podcasts whose summary was already embedded are skipped, first by the hash
+    recorded in Mongo, then by the vector IDs already in Pinecone. When a
+    summary has changed, the vector stored under its previous hash is deleted.
+    
+    Returns:
+        (number of podcasts now in sync, number skipped as unchanged)
+    """
+    try:
+        docs = []
+        previous_hashes = {}
+        unchanged_count = 0
+        for podcast in podcasts:
+            doc = prepare_document(podcast)
+            if not doc:
+                continue
+            if podcast.get(HASH_KEY) == doc.metadata[HASH_KEY]:
+                unchanged_count += 1
+            else:
+                docs.append(doc)
+                if podcast.get(HASH_KEY):
+                    previous_hashes[doc.metadata[HASH_KEY]] = podcast[HASH_KEY]
+        
+        existing_ids = set()
+        if docs:
+            try:
+                existing_ids = await asyncio.to_thread(_fetch_existing_ids, [doc.metadata[HASH_KEY] for doc in docs])
+            except Exception as e:
+                # Upserts are idempotent, so fall back to embedding everything
+                logger.warning(f"Failed to check existing vectors: {str(e)}")
+        existing = [doc for doc in docs if doc.metadata[HASH_KEY] in existing_ids]
+        docs = [doc for doc in docs if doc.metadata[HASH_KEY] not in existing_ids]
+        
+        upserted = []
+        if docs:
+            try:
+                await _aembed_and_upsert(docs)
+                upserted = docs
+            except Exception as e:
+                logger.error(f"Failed to insert {len(docs)} podcast(s) into vector database: {str(e)}")
+        
+        synced = existing + upserted
+        current_ids = {doc.metadata[HASH_KEY] for doc in synced}
+        stale_ids = [
+            previous_hashes[doc.metadata[HASH_KEY]] for doc in synced
+            if previous_hashes.get(doc.metadata[HASH_KEY]) not in (None, *current_ids)
+        ]
+        if stale_ids:
+            try:
+                await asyncio.to_thread(_delete_vectors, stale_ids)
+            except Exception as e:
+                logger.warning(f"Failed to delete {len(stale_ids)} outdated vector(s): {str(e)}")
+        
+        await asyncio.to_thread(_record_embedding_hashes, synced)
+        
+        skipped_count = unchanged_count + len(existing)
+        return skipped_count + len(upserted), skipped_count
+    finally:
+        semaphore.release()
+
+def insert_to_vector_db(podcast: Dict[str, Any], retry_attempts: int = 3) -> bool:
     """
     Insert a podcast summary into Pinecone vector database.
     
     Args:
         podcast: MongoDB podcast document
-        retry_attempts: Number of retry attempts on failure
-        retry_delay: Delay between retries in seconds
+        retry_attempts: Number of attempts before giving up
         
     Returns:
         Success status as boolean
@@ -157,60 +367,76 @@ def insert_to_vector_db(podcast: Dict[str, Any],
     if not doc:
         return False
     
-    # Attempt insertion with retries
-    for attempt in range(retry_attempts):
-        try:
-            vector_store = PineconeVectorStore.from_documents(
-                documents=[doc],
-                index_name=PINECONE_INDEX_NAME,
-                embedding=embeddings,
-                namespace=PINECONE_NAMESPACE
-            )
-            logger.info(f"Successfully inserted podcast '{podcast.get('podcast_title', 'Unknown')}' into Pinecone")
-            return True
-            
-        except Exception as e:
-            logger.warning(f"Attempt {attempt+1}/{retry_attempts} failed: {str(e)}")
-            if attempt < retry_attempts - 1:
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"Failed to insert podcast into vector database after {retry_attempts} attempts")
-                return False
+    if _upsert_documents([doc], retry_attempts):
+        logger.info(f"Successfully inserted podcast '{podcast.get('podcast_title', 'Unknown')}' into Pinecone")
+        return True
+    return False
 
-def sync_latest_podcasts(count: int = 5) -> Dict[str, Any]:
+async def sync_latest_podcasts_async(count: int = 5) -> Dict[str, Any]:
     """
     Synchronize the latest podcasts from MongoDB to Pinecone.
     
+    Podcasts are read from the cursor in EMBEDDING_BATCH_SIZE chunks that are
+    embedded and upserted concurrently, at most SYNC_CONCURRENCY chunks at a time.
+    
     Args:
         count: Number of latest podcasts to synchronize
         
     Returns:
         Dictionary with sync results
     """
-    if not mongo_client or not pc:
+    if not mongo_client or not pc or not embeddings:
         logger.error("Database connections not initialized")
         return {"status": "error", "message": "Database connections not initialized", "synced": 0}
     
-    latest_podcasts = list(get_latest_podcast(limit=count))
+    # Stream the cursor in chunks so memory stays proportional to the number of
+    # chunks in flight rather than to count. A slot is taken before each read,
+    # so reading pauses while SYNC_CONCURRENCY chunks are still being embedded
+    cursor = iter(get_latest_podcast(limit=count))
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+    tasks = []
+    total = 0
+    while True:
+        await semaphore.acquire()
+        podcasts = await asyncio.to_thread(lambda: list(islice(cursor, EMBEDDING_BATCH_SIZE)))
+        if not podcasts:
+            semaphore.release()
+            break
+        total += len(podcasts)
+        tasks.append(asyncio.create_task(_sync_chunk(podcasts, semaphore)))
     
-    if not latest_podcasts:
+    if not total:
         logger.info("No podcasts found to synchronize")
         return {"status": "success", "message": "No podcasts to synchronize", "synced": 0}
     
-    success_count = 0
-    for podcast in latest_podcasts:
-        if insert_to_vector_db(podcast):
-            success_count += 1
-    
+    results = await asyncio.gather(*tasks)
+    success_count = sum(synced for synced, _ in results)
+    skipped_count = sum(skipped for _, skipped in results)
     result = {
-        "status": "success" if success_count > 0 else "partial" if success_count > 0 else "error",
-        "message": f"Synchronized {success_count}/{len(latest_podcasts)} podcasts",
-        "synced": success_count
+        "status": "success" if success_count == total else "partial" if success_count > 0 else "error",
+        "message": f"Synchronized {success_count}/{total} podcasts ({skipped_count} unchanged)",
+        "synced": success_count,
+        "skipped": skipped_count
     }
     
     logger.info(result["message"])
     return result
 
+def sync_latest_podcasts(count: int = 5) -> Dict[str, Any]:
+    """
+    Synchronize the latest podcasts from MongoDB to Pinecone.
+    
+    Blocking wrapper around `sync_latest_podcasts_async`; must not be called
+    from a running event loop.
+    
+    Args:
+        count: Number of latest podcasts to synchronize
+        
+    Returns:
+        Dictionary with sync results
+    """
+    return asyncio.run(sync_latest_podcasts_async(count))
+
 # Example function to perform a semantic search (added functionality)
 def semantic_search(query: str, top_k: int = 3) -> List[Dict[str, Any]]:
     """
@@ -228,25 +454,18 @@ def semantic_search(query: str, top_k: int = 3) -> List[Dict[str, Any]]:
         return []
     
     try:
-        # Create vector store instance
-        vector_store = PineconeVectorStore(
-            index_name=PINECONE_INDEX_NAME,
-            embedding=embeddings,
-            namespace=PINECONE_NAMESPACE
-        )
-        
-        # Perform the search
-        results = vector_store.similarity_search_with_score(query, k=top_k)
+        # Same direct index query as the retriever; repeated queries reuse
+        # their cached embedding
+        matches = _query_index(query_embeddings.embed_query(query), top_k)
+        formatted_results = [
+            {
+                "content": match.page_content,
+                "metadata": match.metadata,
+                "similarity_score": match.score
+            }
+            for match in matches
+        ]
         
-        # Format results
-        formatted_results = []
-        for doc, score in results:
-            formatted_results.append({
-                "content": doc.page_content,
-                "metadata": doc.metadata,
-                "similarity_score": score
-            })
-            
         return formatted_results
         
     except Exception as e:
@@ -0,0 +1,64 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Load the module by path so the test does not import retriever/__init__.py,
+# which connects to Pinecone and OpenAI at import time
+_PATH = pathlib.Path(__file__).resolve().parents[1] / "src" / "retriever" / "semantic_cache.py"
+_spec = importlib.util.spec_from_file_location("semantic_cache", _PATH)
+semantic_cache = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(semantic_cache)
+SemanticCache = semantic_cache.SemanticCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_within_ttl(clock):
+    cache = SemanticCache(max_entries=4, ttl=10)
+    cache.put([1.0, 0.0], "a")
+
+    assert cache.lookup([1.0, 0.0], threshold=0.9) == (pytest.approx(1.0), "a")
+
+
+def test_expired_entry_is_replaced_by_repeated_query(clock):
+    cache = SemanticCache(max_entries=4, ttl=10)
+    cache.put([1.0, 0.0], "old")
+
+    clock[0] += 11
+    assert cache.lookup([1.0, 0.0], threshold=0.9) is None
+
+    cache.put([1.0, 0.0], "new")
+    assert len(cache) == 1
+    assert cache.lookup([1.0, 0.0], threshold=0.9)[1] == "new"
+
+
+def test_expired_slot_is_reused_before_appending(clock):
+    cache = SemanticCache(max_entries=4, ttl=10)
+    cache.put([1.0, 0.0], "a")
+
+    clock[0] += 11
+    cache.put([0.0, 1.0], "b")
+
+    assert len(cache) == 1
+    assert cache.lookup([1.0, 0.0], threshold=0.9) is None
+    assert cache.lookup([0.0, 1.0], threshold=0.9)[1] == "b"
+
+
+def test_least_recently_used_entry_is_evicted_when_full(clock):
+    cache = SemanticCache(max_entries=2)
+    cache.put([1.0, 0.0], "a")
+    cache.put([0.0, 1.0], "b")
+    cache.lookup([1.0, 0.0], threshold=0.9)
+
+    cache.put([1.0, 1.0], "c")
+
+    assert cache.lookup([1.0, 0.0], threshold=0.9)[1] == "a"
+    assert cache.lookup([0.0, 1.0], threshold=0.9) is None
@@ -0,0 +1,49 @@
+import pathlib
+import sys
+import types
+
+import pytest
+
+for _module in ("flask", "flask_cors", "flask_compress", "orjson", "pydantic", "dotenv"):
+    pytest.importorskip(_module)
+
+_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+
+
+def _not_called(*args, **kwargs):
+    raise AssertionError("the retriever must not run for an invalid request")
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Stand in for the retriever, which connects to Pinecone and OpenAI at
+    # import time, and for the MongoDB schema module
+    retriever = types.ModuleType("src.api.retriever")
+    retriever.retrieve_and_respond = _not_called
+    retriever.retrieve_and_stream = _not_called
+    retriever.llm = None
+    schema = types.ModuleType("src.db.schema")
+    schema.get_podcast_collection = _not_called
+
+    saved_path = list(sys.path)
+    saved_modules = dict(sys.modules)
+    sys.path.insert(0, _ROOT)
+    sys.modules["src.api.retriever"] = retriever
+    sys.modules["src.db.schema"] = schema
+    try:
+        from src.api import server
+        yield server.app.test_client()
+    finally:
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - set(saved_modules):
+            del sys.modules[name]
+
+
+@pytest.mark.parametrize("body", [b"", b"{bad", b"[]", b'{"message": ""}'])
+def test_chat_rejects_invalid_body(client, body):
+    response = client.post("/api/v1/chat", data=body, content_type="application/json")
+
+    assert response.status_code == 400
+    payload = response.get_json()
+    assert payload["status"] == "error"
+    assert payload["message"]